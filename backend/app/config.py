@@ -1,11 +1,18 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     APP_NAME: str = "Stock Monitor API"
     VERSION: str = "1.0.0"
-    SQLALCHEMY_DATABASE_URL: str = "sqlite:///./stock_monitor.db"
+    SQLALCHEMY_DATABASE_URL: str = "sqlite+aiosqlite:///./stock_monitor.db"
+    CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
     class Config:
         env_file = ".env"  # optional if you want to move DB URL to .env later
 
-settings = Settings()
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once; repeat callers skip the env re-scan."""
+    return Settings()
@@ -1,27 +1,60 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 # Create engine
 connect_args = {}
 if settings.SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(
+engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URL,
     connect_args=connect_args,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+
+_is_file_sqlite = (
+    settings.SQLALCHEMY_DATABASE_URL.startswith("sqlite")
+    and ":memory:" not in settings.SQLALCHEMY_DATABASE_URL
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if _is_file_sqlite:
+    # WAL lets readers and writers proceed concurrently instead of the
+    # default journal_mode=DELETE, which serializes every request.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
+
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
 
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
+# Dependency to get DB session.
+# The session itself is cheap: a connection is only checked out of the
+# pool on the first execute() and returned when the session closes after
+# the response. Routes must finish external I/O (e.g. the yfinance
+# lookup) *before* touching the session, so slow network calls never
+# pin a pooled connection.
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,27 +1,52 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.config import settings
+from app.config import get_settings
 from app.db.database import Base, engine
 from app.routers import tickers
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+settings = get_settings()
+
+
+def _create_missing_indexes(conn):
+    # create_all skips tables that already exist, indexes included, so
+    # indexes added after a db file was first created (e.g.
+    # ix_active_ticker) need an explicit idempotent pass.
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+    yield
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     description="API for managing stock tickers to monitor",
     version=settings.VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware: explicit origins/methods keep the per-request header
+# work minimal, and max_age lets browsers cache preflights for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 # Include routers
@@ -44,6 +69,20 @@ def read_root():
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("ENV") == "prod":
+        # Multi-worker is safe with SQLite here because the engine sets
+        # WAL mode and a busy_timeout on every connection.
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WORKERS", str(os.cpu_count()))),
+            loop="uvloop",
+            http="httptools",
+        )
+    else:
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
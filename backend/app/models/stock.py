@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
 from datetime import datetime
 
 from app.db.database import Base
@@ -6,6 +6,9 @@ from app.db.database import Base
 
 class StockTicker(Base):
     __tablename__ = "stock_tickers"
+    # Covers the list_tickers query (WHERE is_active ORDER BY ticker)
+    # with a single index range scan, no filesort.
+    __table_args__ = (Index("ix_active_ticker", "is_active", "ticker"),)
 
     id = Column(Integer, primary_key=True, index=True)
     ticker = Column(String, unique=True, index=True, nullable=False)
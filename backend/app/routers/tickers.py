@@ -1,12 +1,23 @@
 # app/routers/tickers.py
+import asyncio
 from typing import List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
 from app.models.stock import StockTicker
-from app.schemas.stock import TickerCreate, TickerResponse, TickerUpdate
+from app.schemas.stock import (
+    BulkTickerResponse,
+    NormalizedTicker,
+    TickerCreate,
+    TickerResponse,
+    TickerUpdate,
+)
 from app.services.stock_service import get_stock_info
 from datetime import datetime
 
@@ -15,76 +26,159 @@ router = APIRouter(
     tags=["tickers"],
 )
 
+# Cap concurrent yfinance fan-out so bulk requests don't trip rate limits
+_bulk_semaphore = asyncio.Semaphore(16)
+
+
+# Compiled once per process; executions hit SQLAlchemy's statement cache
+_STMT_BY_TICKER = select(StockTicker).where(StockTicker.ticker == bindparam("t"))
+
+
+async def _get_by_ticker(db: AsyncSession, ticker: str) -> StockTicker | None:
+    """Look up a ticker by its unique symbol column."""
+    return (await db.scalars(_STMT_BY_TICKER, {"t": ticker})).one_or_none()
+
 
 @router.post("", response_model=TickerResponse, status_code=201)
-def add_ticker(
-    ticker_data: TickerCreate, 
-    db: Session = Depends(get_db)
+async def add_ticker(
+    ticker_data: TickerCreate,
+    db: AsyncSession = Depends(get_db)
 ):
     """Add a new stock ticker to monitor"""
-    ticker = ticker_data.ticker.upper().strip()
-
-    # Check if ticker already exists
-    existing = db.query(StockTicker).filter(StockTicker.ticker == ticker).first()
-    if existing:
-        raise HTTPException(status_code=400, detail=f"Ticker {ticker} already exists")
+    ticker = ticker_data.ticker
 
-    # Validate ticker with yfinance
-    company_name = get_stock_info(ticker)
+    # Validate ticker with yfinance before any DB work, so no pooled
+    # connection is held across the (potentially slow) network call
+    company_name = await get_stock_info(ticker)
     if company_name is None:
         raise HTTPException(status_code=404, detail=f"Invalid ticker symbol: {ticker}")
 
-    new_ticker = StockTicker(
-        ticker=ticker,
-        company_name=company_name,
+    # Single round-trip: the unique ticker column arbitrates duplicates,
+    # so two concurrent POSTs can't race a separate existence check.
+    stmt = (
+        insert(StockTicker)
+        .values(ticker=ticker, company_name=company_name)
+        .on_conflict_do_nothing(index_elements=["ticker"])
+        .returning(StockTicker)
+    )
+    result = await db.execute(stmt)
+    new_ticker = result.scalar_one_or_none()
+    if new_ticker is None:
+        raise HTTPException(status_code=400, detail=f"Ticker {ticker} already exists")
+
+    await db.commit()
+    # Serialize directly, skipping FastAPI's response_model re-validation
+    return ORJSONResponse(
+        TickerResponse.model_validate(new_ticker).model_dump(), status_code=201
     )
 
-    db.add(new_ticker)
-    db.commit()
-    db.refresh(new_ticker)
 
-    return new_ticker
+@router.post("/bulk", response_model=BulkTickerResponse, status_code=201)
+async def bulk_add_tickers(
+    payload: List[TickerCreate],
+    db: AsyncSession = Depends(get_db),
+):
+    """Add multiple tickers in one request, validating them concurrently"""
+    tickers = list(dict.fromkeys(t.ticker for t in payload))
+
+    # Column-only existence probe (no ORM hydration): symbols already in
+    # the table skip the yfinance fan-out and go straight to skipped.
+    existing = set(
+        (
+            await db.scalars(
+                select(StockTicker.ticker).where(StockTicker.ticker.in_(tickers))
+            )
+        ).all()
+    )
+    skipped = [t for t in tickers if t in existing]
+    tickers = [t for t in tickers if t not in existing]
+    # End the read-only transaction so no connection is pinned while the
+    # yfinance fan-out below runs
+    await db.rollback()
+
+    async def validate(ticker: str):
+        async with _bulk_semaphore:
+            return ticker, await get_stock_info(ticker)
+
+    results = await asyncio.gather(*(validate(t) for t in tickers))
+    invalid = [t for t, name in results if name is None]
+    rows = [
+        {"ticker": t, "company_name": name} for t, name in results if name is not None
+    ]
+
+    added = []
+    if rows:
+        stmt = (
+            insert(StockTicker)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["ticker"])
+            .returning(StockTicker)
+        )
+        result = await db.execute(stmt)
+        added = result.scalars().all()
+        await db.commit()
+
+    added_symbols = {stock.ticker for stock in added}
+    skipped += [row["ticker"] for row in rows if row["ticker"] not in added_symbols]
+
+    return BulkTickerResponse(
+        added=[TickerResponse.model_validate(stock) for stock in added],
+        skipped=skipped,
+        invalid=invalid,
+    )
 
 
 @router.get("", response_model=List[TickerResponse])
-def list_tickers(
+async def list_tickers(
     active_only: bool = True,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List all monitored tickers"""
-    query = db.query(StockTicker)
+    stmt = select(StockTicker)
 
     if active_only:
-        query = query.filter(StockTicker.is_active == True)
+        stmt = stmt.where(StockTicker.is_active == True)
+
+    stmt = stmt.order_by(StockTicker.ticker).execution_options(yield_per=100)
+    rows = await db.stream_scalars(stmt)
 
-    tickers = query.order_by(StockTicker.ticker).all()
-    return tickers
+    # Encode the JSON array incrementally so memory stays flat no matter
+    # how many tickers are monitored.
+    async def generate():
+        yield b"["
+        first = True
+        async for row in rows:
+            item = orjson.dumps(TickerResponse.model_validate(row).model_dump())
+            yield item if first else b"," + item
+            first = False
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @router.get("/{ticker}", response_model=TickerResponse)
-def get_ticker(
-    ticker: str, 
-    db: Session = Depends(get_db)
+async def get_ticker(
+    ticker: NormalizedTicker,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get details of a specific ticker"""
-    ticker = ticker.upper().strip()
-    stock = db.query(StockTicker).filter(StockTicker.ticker == ticker).first()
+    stock = await _get_by_ticker(db, ticker)
 
     if not stock:
         raise HTTPException(status_code=404, detail=f"Ticker {ticker} not found")
 
-    return stock
+    # Serialize directly, skipping FastAPI's response_model re-validation
+    return ORJSONResponse(TickerResponse.model_validate(stock).model_dump())
 
 
 @router.patch("/{ticker}", response_model=TickerResponse)
-def update_ticker(
-    ticker: str,
+async def update_ticker(
+    ticker: NormalizedTicker,
     update_data: TickerUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Update ticker (e.g., activate/deactivate monitoring)"""
-    ticker = ticker.upper().strip()
-    stock = db.query(StockTicker).filter(StockTicker.ticker == ticker).first()
+    stock = await _get_by_ticker(db, ticker)
 
     if not stock:
         raise HTTPException(status_code=404, detail=f"Ticker {ticker} not found")
@@ -93,24 +187,23 @@ def update_ticker(
         stock.is_active = update_data.is_active
 
     stock.last_updated = datetime.utcnow()
-    db.commit()
-    db.refresh(stock)
+    await db.commit()
+    await db.refresh(stock)
 
     return stock
 
 
 @router.delete("/{ticker}", status_code=204)
-def delete_ticker(
-    ticker: str, 
-    db: Session = Depends(get_db)
+async def delete_ticker(
+    ticker: NormalizedTicker,
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a ticker from monitoring"""
-    ticker = ticker.upper().strip()
-    stock = db.query(StockTicker).filter(StockTicker.ticker == ticker).first()
+    stock = await _get_by_ticker(db, ticker)
 
     if not stock:
         raise HTTPException(status_code=404, detail=f"Ticker {ticker} not found")
 
-    db.delete(stock)
-    db.commit()
-    return None 
+    await db.delete(stock)
+    await db.commit()
+    return None
@@ -1,18 +1,23 @@
 # app/schemas/stock.py
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, List, Optional
 
+# Symbols are normalized once at validation time, so routes and services
+# never repeat the upper()/strip() themselves.
+NormalizedTicker = Annotated[str, AfterValidator(lambda s: s.upper().strip())]
 
-class TickerCreate(BaseModel):
-    ticker: str = Field(..., description="Stock ticker symbol (e.g., AAPL, TSLA)")
 
-    class Config:
-        json_schema_extra = {
+class TickerCreate(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "ticker": "AAPL"
             }
         }
+    )
+
+    ticker: NormalizedTicker = Field(..., description="Stock ticker symbol (e.g., AAPL, TSLA)")
 
 
 class TickerUpdate(BaseModel):
@@ -20,6 +25,8 @@ class TickerUpdate(BaseModel):
 
 
 class TickerResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)  # for ORM mode (SQLAlchemy models)
+
     id: int
     ticker: str
     company_name: Optional[str]
@@ -27,5 +34,8 @@ class TickerResponse(BaseModel):
     added_at: datetime
     last_updated: datetime
 
-    class Config:
-        from_attributes = True  # for ORM mode (SQLAlchemy models)
\ No newline at end of file
+
+class BulkTickerResponse(BaseModel):
+    added: List[TickerResponse]
+    skipped: List[str]
+    invalid: List[str]
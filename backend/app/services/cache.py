@@ -0,0 +1,55 @@
+# app/services/cache.py
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+
+class SqliteCache:
+    """Small on-disk ticker -> company_name cache with a TTL.
+
+    Survives worker restarts and --reload, so a ticker validated once
+    doesn't need another yfinance round-trip for `ttl` seconds.
+    """
+
+    def __init__(self, path: str = ".cache/ticker_info.db", ttl: int = 90 * 86400):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ticker_info_cache ("
+                "ticker TEXT PRIMARY KEY, "
+                "company_name TEXT NOT NULL, "
+                "cached_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def get(self, ticker: str) -> Optional[str]:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT company_name, cached_at FROM ticker_info_cache WHERE ticker = ?",
+                (ticker,),
+            ).fetchone()
+            if row is None:
+                return None
+            company_name, cached_at = row
+            if time.time() - cached_at > self.ttl:
+                conn.execute(
+                    "DELETE FROM ticker_info_cache WHERE ticker = ?", (ticker,)
+                )
+                return None
+            return company_name
+
+    def set(self, ticker: str, company_name: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO ticker_info_cache (ticker, company_name, cached_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT(ticker) DO UPDATE SET "
+                "company_name = excluded.company_name, cached_at = excluded.cached_at",
+                (ticker, company_name, time.time()),
+            )
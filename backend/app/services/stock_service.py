@@ -1,17 +1,63 @@
 # app/services/stock_service.py
+import asyncio
+import re
+from functools import lru_cache
 from typing import Optional
-import yfinance as yf
 
+from app.services.cache import SqliteCache
 
-def get_stock_info(ticker: str) -> Optional[str]:
-    """Validate ticker and return company name using yfinance."""
-    try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+# Shared across workers and restarts, unlike the in-process LRU below.
+_persistent_cache = SqliteCache()
+
+# Symbols are 1-6 chars: a letter then letters/digits/./- (e.g. BRK.B).
+_VALID_TICKER = re.compile(r"^[A-Z][A-Z0-9.\-]{0,5}$")
+
+
+@lru_cache(maxsize=1024)
+def _cached_lookup(ticker: str) -> Optional[str]:
+    """Validate ticker and return company name using yfinance.
 
-        # Check if ticker is valid
-        if "symbol" in info or "shortName" in info:
-            return info.get("shortName", info.get("longName", ticker))
+    Cached so repeat submissions of the same ticker skip the HTTP
+    round-trip. Use `_cached_lookup.cache_clear()` to reset in tests.
+    Exceptions propagate uncached, so a transient network failure
+    doesn't permanently mark a valid ticker as invalid; only definite
+    answers (regex rejects, Yahoo "unknown symbol", resolved names) are
+    memoized.
+    """
+    # Reject obviously-invalid symbols without spending a network call
+    if not _VALID_TICKER.match(ticker):
         return None
+
+    cached = _persistent_cache.get(ticker)
+    if cached is not None:
+        return cached
+
+    # Imported lazily: yfinance pulls in pandas, which costs ~200ms at
+    # startup for every worker even if no ticker is ever validated.
+    import yfinance as yf
+
+    stock = yf.Ticker(ticker)
+    info = stock.info
+
+    # Check if ticker is valid
+    if "symbol" in info or "shortName" in info:
+        company_name = info.get("shortName", info.get("longName", ticker))
+        _persistent_cache.set(ticker, company_name)
+        return company_name
+    return None
+
+
+def _sync_get_stock_info(ticker: str) -> Optional[str]:
+    try:
+        return _cached_lookup(ticker)
     except Exception:
         return None
+
+
+async def get_stock_info(ticker: str) -> Optional[str]:
+    """Validate ticker and return company name, off the event loop.
+
+    yfinance does blocking HTTP, so run it in a worker thread instead of
+    stalling the request handler.
+    """
+    return await asyncio.to_thread(_sync_get_stock_info, ticker.upper().strip())